@@ -1,35 +1,43 @@
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import List, Dict, Set
+import collections
+import numpy as np
 from .models import ScheduledTask
 
+def _to_datetime(np_day) -> datetime:
+    # datetime64[D] -> datetime at midnight
+    d = np_day.astype('datetime64[D]').astype(object)
+    return datetime(d.year, d.month, d.day)
+
+@lru_cache(maxsize=4096)
+def _parse_ymd(s: str) -> datetime:
+    # Bounded cache: polled task lists repeat the same few dates many times.
+    # fromisoformat is a C-level parser; no format-string interpretation.
+    return datetime.fromisoformat(s)
+
 def add_business_days(from_date: datetime, days_to_add: int) -> datetime:
-    current = from_date
-    while days_to_add > 0:
-        current += timedelta(days=1)
-        if current.weekday() < 5: # Mon-Fri
-            days_to_add -= 1
-    return current
+    # C-vectorized busday_offset instead of walking day-by-day in Python.
+    # roll='backward' matches the old loop: from a weekend, +1 lands on Monday.
+    if days_to_add <= 0:
+        return from_date
+    result = np.busday_offset(np.datetime64(from_date.date(), 'D'), days_to_add, roll='backward')
+    return _to_datetime(result)
 
 def count_business_days(start: datetime, end: datetime) -> int:
-    # Inclusive count
-    days = 0
-    curr = start
-    while curr <= end:
-        if curr.weekday() < 5:
-            days += 1
-        curr += timedelta(days=1)
-    return days
+    # Inclusive count (numpy is end-exclusive, so add one day)
+    if start > end:
+        return 0
+    return int(np.busday_count(start.date(), (end + timedelta(days=1)).date()))
 
 def subtract_business_days_offset(end_date: datetime, business_days_needed: int) -> datetime:
     # Find Start such that AddBiz(Start, days-1) = End
-    # Simplified: Walk backwards 'business_days_needed - 1' steps
-    count = business_days_needed - 1
-    curr = end_date
-    while count > 0:
-        curr -= timedelta(days=1)
-        if curr.weekday() < 5:
-            count -= 1
-    return curr
+    # roll='forward' matches the old backwards walk from a weekend end date.
+    steps = business_days_needed - 1
+    if steps <= 0:
+        return end_date
+    result = np.busday_offset(np.datetime64(end_date.date(), 'D'), -steps, roll='forward')
+    return _to_datetime(result)
 
 
 def recalculate_dates(tasks: List[ScheduledTask], changed_task_gid: str, new_end_date_str: str) -> List[ScheduledTask]:
@@ -39,23 +47,24 @@ def recalculate_dates(tasks: List[ScheduledTask], changed_task_gid: str, new_end
     For this implementation, we will rebuild the graph and propagate changes.
     """
     
-    # 1. Map tasks by GID (or Name if GID not available, but Asana has GIDs)
-    # We need to rely on the fact that we are passed current Asana state.
-    # In Asana, dependencies are GIDs.
-    
-    task_map = {t.gid: t for t in tasks if hasattr(t, 'gid') and t.gid} 
-    # If tasks coming from Asana don't have 'gid' attribute populated in the list directly? 
-    # The Asana fetch returns dicts, but we might be passing Pydantic models.
-    # Let's assume input is list of dicts or objects that have 'gid', 'dependencies', 'duration', 'start_date', 'end_date'
-    
-    # Let's handle generic object access safely
+    # 1. Map tasks by GID. In Asana, dependencies are GIDs.
+    # Asana payloads are plain dicts; normalize any ScheduledTask objects to
+    # the same dict shape ONCE here so the hot BFS body below can use straight
+    # key access instead of a getattr/get fallback chain per field.
     task_db = {}
     for t in tasks:
-        # t might be a ScheduledTask or a dict from Asana
-        gid = getattr(t, 'gid', None) or t.get('gid')
+        if not isinstance(t, dict):
+            t = {
+                'gid': getattr(t, 'gid', None),
+                'name': getattr(t, 'name', None),
+                'start_on': getattr(t, 'start_date', None),
+                'due_on': getattr(t, 'end_date', None),
+                'dependencies': list(getattr(t, 'dependencies', None) or [])
+            }
+        gid = t.get('gid')
         if gid:
             task_db[gid] = t
-            
+
     if changed_task_gid not in task_db:
         return [] # Changed task not found
         
@@ -64,48 +73,20 @@ def recalculate_dates(tasks: List[ScheduledTask], changed_task_gid: str, new_end
     
     # Calculate offset
     try:
-        old_end = datetime.strptime(getattr(changed_task, 'end_date', None) or changed_task['due_on'], "%Y-%m-%d")
-        new_end = datetime.strptime(new_end_date_str, "%Y-%m-%d")
-        
+        old_end = _parse_ymd(changed_task['due_on'])
+        new_end = _parse_ymd(new_end_date_str)
+
         # Update the task
-        if isinstance(changed_task, dict):
-            changed_task['due_on'] = new_end_date_str
-            changed_task['due_on'] = new_end_date_str
-            
-            # Calculate duration (Inclusive Workdays)
-            old_start = datetime.strptime(changed_task['start_on'], "%Y-%m-%d")
-            
-            # If new end < old start, we need to respect physics or just shift start?
-            # User wants "shift" usually.
-            # Let's recalculate Duration based on OLD relationship if possible, OR just count current days?
-            # "reduce the deadline by 2 days ... dependent task shift".
-            # This implies the task duration GETS SHORTENED? Or just moved?
-            # "reduce days to complete" -> Shorter Duration.
-            # "move to 31st Jan" -> Move End Date.
-            # If I Just move End Date, do I keep Start Date? 
-            # If "reduce days to complete", then Duration changes. Start stays same.
-            
-            # Recalculate Duration:
-            new_duration = count_business_days(old_start, new_end)
-            if new_duration < 1: new_duration = 1
-            
-            # We DONT shift start here. We updated End. Duration changed.
-            # Start stays same (unless end < start, handled by duration >= 1 imply end>=start).
-            
-            # Wait, if user MOVES the task (drag and drop), Start AND End might move.
-            # But here we only get `new_end_date`.
-            # If user dragged whole task, Start also changed in Asana.
-            # But our polling sees "Task Changed" -> auto_recalibrate.
-            # This function `recalculate_dates` is for the MANUAL endpoint.
-            # If User uses Endpoint "Update Task Date", they provide New End.
-            # Usually implies "Deadline Extended/Shortened". Start constant.
-            
-            pass # Start remains same. Logic handles dependencies below.
-            
-        else:
-             # Pydantic/Object
-             # Note: ScheduledTask uses 'start_date', Asana uses 'start_on'. normalizing...
-             pass 
+        changed_task['due_on'] = new_end_date_str
+
+        # Calculate duration (Inclusive Workdays)
+        old_start = _parse_ymd(changed_task['start_on'])
+
+        # If user "reduces days to complete" the Duration changes; if they
+        # "move the end date" the End moves. Either way we only get a new End
+        # here, so: Start stays the same, Duration is recomputed.
+        new_duration = count_business_days(old_start, new_end)
+        if new_duration < 1: new_duration = 1
 
     except Exception as e:
         print(f"Error parsing dates: {e}")
@@ -114,31 +95,30 @@ def recalculate_dates(tasks: List[ScheduledTask], changed_task_gid: str, new_end
     # 3. Build Dependency Graph (Successor Map)
     successors = collections.defaultdict(list)
     for gid, t in task_db.items():
-        deps = getattr(t, 'dependencies', []) or t.get('dependencies', [])
+        deps = t.get('dependencies', [])
         for pred_gid in deps:
             successors[pred_gid].append(gid)
 
     # 4. Propagate (BFS)
-    queue = [changed_task_gid]
+    # deque: O(1) popleft vs O(N) list.pop(0)
+    queue = collections.deque([changed_task_gid])
     visited = set()
+    # Track membership in a gid set: O(1) vs linear scan of the list
+    modified_set = {changed_task_gid}
     modified_tasks = [changed_task]
-    
+
     while queue:
-        current_gid = queue.pop(0)
+        current_gid = queue.popleft()
         if current_gid in visited: continue
         visited.add(current_gid)
         
         current_task = task_db[current_gid]
-        current_end_date = datetime.strptime(
-            (getattr(current_task, 'end_date', None) or getattr(current_task, 'due_on', None) or current_task.get('due_on')), 
-            "%Y-%m-%d"
-        )
+        current_end_date = _parse_ymd(current_task['due_on'])
         
         # Check successors
         for suc_gid in successors[current_gid]:
             suc_task = task_db[suc_gid]
-            suc_start_str = getattr(suc_task, 'start_date', None) or getattr(suc_task, 'start_on', None) or suc_task.get('start_on')
-            suc_start = datetime.strptime(suc_start_str, "%Y-%m-%d")
+            suc_start = _parse_ymd(suc_task['start_on'])
             
             # Constraint: Successor Start >= Predecessor End + Lag (0)
             # If Successor Start < Current End (Predecessor Finish), we must push Successor
@@ -155,21 +135,17 @@ def recalculate_dates(tasks: List[ScheduledTask], changed_task_gid: str, new_end
                 new_suc_start = current_end_date
                 
                 # Keep duration constant
-                suc_end_str = getattr(suc_task, 'end_date', None) or getattr(suc_task, 'due_on', None) or suc_task.get('due_on')
-                suc_end = datetime.strptime(suc_end_str, "%Y-%m-%d")
+                suc_end = _parse_ymd(suc_task['due_on'])
                 duration = (suc_end - suc_start).days
                 
                 new_suc_end = new_suc_start + timedelta(days=duration)
                 
                 # Update Successor
-                if isinstance(suc_task, dict):
-                    suc_task['start_on'] = new_suc_start.strftime("%Y-%m-%d")
-                    suc_task['due_on'] = new_suc_end.strftime("%Y-%m-%d")
-                else:
-                    setattr(suc_task, 'start_date', new_suc_start.strftime("%Y-%m-%d"))
-                    setattr(suc_task, 'end_date', new_suc_end.strftime("%Y-%m-%d"))
-
-                if suc_task not in modified_tasks:
+                suc_task['start_on'] = new_suc_start.date().isoformat()
+                suc_task['due_on'] = new_suc_end.date().isoformat()
+
+                if suc_gid not in modified_set:
+                   modified_set.add(suc_gid)
                    modified_tasks.append(suc_task)
                 
                 queue.append(suc_gid)
@@ -181,84 +157,118 @@ def auto_recalibrate(tasks: List[dict]) -> List[dict]:
     Iterates through tasks to find dependency violations and shifts dependent tasks forward.
     Returns the list of tasks that were modified.
     """
-    import collections
-    
-    # 1. Map GID -> Task
+    # 1. Map GID -> Task and assign each one a dense index so the date math
+    # below can run on numpy arrays instead of per-task dict lookups.
     task_map = {t['gid']: t for t in tasks if t.get('gid')}
-    
-    # 2. Build Adjacency and Indegree for Topological Sort
-    graph = collections.defaultdict(list)
-    indegree = {gid: 0 for gid in task_map}
-    
+    gids = list(task_map)
+    n = len(gids)
+    if n == 0:
+        return []
+    idx = {gid: i for i, gid in enumerate(gids)}
+
+    # 2. Parse all dates ONCE into datetime64[D] arrays
+    starts = np.empty(n, dtype='datetime64[D]')
+    dues = np.empty(n, dtype='datetime64[D]')
+    valid = np.ones(n, dtype=bool)
+    today = np.datetime64(datetime.now().date(), 'D')
+    for i, gid in enumerate(gids):
+        t = task_map[gid]
+        try:
+            # np.datetime64(None) yields NaT instead of raising, and one
+            # NaT poisons the whole busday_count batch below — reject
+            # missing dates explicitly.
+            if not t.get('start_on') or not t.get('due_on'):
+                raise ValueError('missing date')
+            starts[i] = np.datetime64(t['start_on'], 'D')
+            dues[i] = np.datetime64(t['due_on'], 'D')
+        except (ValueError, TypeError):
+            starts[i] = dues[i] = today # placeholder, excluded via valid mask
+            valid[i] = False
+
+    # Workday durations for the whole project in ONE busday_count call
+    # (numpy is end-exclusive, so add a day for the inclusive count)
+    durations = np.busday_count(starts, dues + np.timedelta64(1, 'D'))
+    np.maximum(durations, 1, out=durations)
+
+    # 3. Flatten edges into two int32 arrays instead of a defaultdict of
+    # lists: CSR layout for successors, indegrees via one bincount.
+    dep_src = []
+    dep_dst = []
+    pred_indices = [[] for _ in range(n)]
+
     for gid, t in task_map.items():
-        deps = t.get('dependencies', [])
-        for pred_gid in deps:
-            if pred_gid in task_map:
-                graph[pred_gid].append(gid)
-                indegree[gid] += 1
-                
-    # 3. Topological Sort
-    queue = [gid for gid in task_map if indegree[gid] == 0]
-    sorted_gids = []
-    
+        u = idx[gid]
+        for pred_gid in t.get('dependencies', []):
+            if pred_gid in idx:
+                p = idx[pred_gid]
+                dep_src.append(p)
+                dep_dst.append(u)
+                pred_indices[u].append(p)
+
+    dep_src = np.asarray(dep_src, dtype=np.int32)
+    dep_dst = np.asarray(dep_dst, dtype=np.int32)
+    indegree = np.bincount(dep_dst, minlength=n)
+
+    # CSR: successors of u live in succ_indices[indptr[u]:indptr[u+1]]
+    order = np.argsort(dep_src, kind='stable')
+    succ_indices = dep_dst[order]
+    indptr = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum(np.bincount(dep_src, minlength=n), out=indptr[1:])
+
+    # Freeze predecessor lists into int32 arrays so the gather below
+    # (dues[preds]) is a single fancy-index instead of list iteration.
+    pred_indices = [np.asarray(p, dtype=np.int32) for p in pred_indices]
+
+    # 4. Topological Sort (Kahn) over integer indices
+    # deque: O(1) popleft vs O(N) list.pop(0)
+    queue = collections.deque(np.flatnonzero(indegree == 0).tolist())
+    sorted_idx = []
+
     while queue:
-        u = queue.pop(0)
-        sorted_gids.append(u)
-        for v in graph[u]:
-            indegree[v] -= 1
+        u = queue.popleft()
+        sorted_idx.append(u)
+        succs = succ_indices[indptr[u]:indptr[u + 1]]
+        if succs.size == 0: continue
+        # subtract.at handles duplicate edges correctly
+        np.subtract.at(indegree, succs, 1)
+        for v in np.unique(succs):
             if indegree[v] == 0:
-                queue.append(v)
-    
-    # If cycle exists (graph not fully traversed), we just process what we found 
-    # or handle the leftovers. For now, rely on sorted_gids.
-    
+                queue.append(int(v))
+
+    # If cycle exists (graph not fully traversed), we just process what we found
+    # or handle the leftovers. For now, rely on sorted_idx.
+
     modified_tasks = []
-    
-    # 4. Forward Pass to resolve violations
-    # We visit tasks in topological order. For each task, ensure it starts AFTER all preds end.
-    
-    for gid in sorted_gids:
-        task = task_map[gid]
-        
-        try:
-            current_start = datetime.strptime(task['start_on'], "%Y-%m-%d")
-            current_due = datetime.strptime(task['due_on'], "%Y-%m-%d")
-            current_start = datetime.strptime(task['start_on'], "%Y-%m-%d")
-            current_due = datetime.strptime(task['due_on'], "%Y-%m-%d")
-            # Workday Duration
-            duration = count_business_days(current_start, current_due)
-            if duration < 1: duration = 1
-            
-            # Find max predecessor end date
-            max_pred_end = None
-            
-            # task['dependencies'] are Predecessor GIDs
-            preds = [task_map[p_gid] for p_gid in task.get('dependencies', []) if p_gid in task_map]
-            
-            for pred in preds:
-                pred_due = datetime.strptime(pred['due_on'], "%Y-%m-%d")
-                if max_pred_end is None or pred_due > max_pred_end:
-                    max_pred_end = pred_due
-            
-            # Check Violation or Gap: Start != Max Pred End
-            if max_pred_end and current_start != max_pred_end:
-                # Needs Shift (Push OR Pull)
-                new_start = max_pred_end
-                
-                # Check weakend snap
-                while new_start.weekday() >= 5:
-                    new_start += timedelta(days=1)
-                    
-                new_due = add_business_days(new_start, duration - 1)
-                
-                # Update
-                task['start_on'] = new_start.strftime("%Y-%m-%d")
-                task['due_on'] = new_due.strftime("%Y-%m-%d")
-                
-                modified_tasks.append(task)
-                
-        except (ValueError, TypeError):
-            continue 
-            
+
+    # 5. Forward Pass to resolve violations.
+    # dues acts as the effective-due array, so each task sees its
+    # predecessors' already-shifted dates via a single gather+max.
+    for u in sorted_idx:
+        if not valid[u]: continue
+        preds = pred_indices[u]
+        if preds.size == 0: continue
+
+        # Invalid rows carry placeholder dates; mask them out of the
+        # gather so they can never drive a shift of a valid successor.
+        preds = preds[valid[preds]]
+        if preds.size == 0: continue
+
+        max_pred_end = dues[preds].max()
+
+        # Check Violation or Gap: Start != Max Pred End
+        if starts[u] != max_pred_end:
+            # Needs Shift (Push OR Pull); snap weekends forward
+            new_start = np.busday_offset(max_pred_end, 0, roll='forward')
+            new_due = np.busday_offset(new_start, durations[u] - 1, roll='backward')
+
+            starts[u] = new_start
+            dues[u] = new_due
+
+            task = task_map[gids[u]]
+            task['start_on'] = str(new_start)
+            task['due_on'] = str(new_due)
+
+            modified_tasks.append(task)
+
     return modified_tasks
 
@@ -0,0 +1,155 @@
+import io
+import re
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from xml.etree import ElementTree
+
+# Streaming .xlsx reader for /parse-excel.
+# openpyxl.load_workbook builds a DOM of every cell before we can iterate,
+# which for big schedule files costs many times the uncompressed XML size in
+# RAM. Here we read sharedStrings.xml and the bold-style table once, then
+# iterparse the worksheet XML and yield one row at a time — O(1) memory per row.
+
+NS = '{http://schemas.openxmlformats.org/spreadsheetml/2006/main}'
+REL_NS = '{http://schemas.openxmlformats.org/package/2006/relationships}'
+RID_ATTR = '{http://schemas.openxmlformats.org/officeDocument/2006/relationships}id'
+
+_CELL_REF = re.compile(r'([A-Z]+)\d+$')
+
+def _col_index(ref):
+    # 'A1' -> 0, 'AB12' -> 27
+    m = _CELL_REF.match(ref or '')
+    if not m:
+        return None
+    idx = 0
+    for ch in m.group(1):
+        idx = idx * 26 + (ord(ch) - 64)
+    return idx - 1
+
+def _first_sheet_path(zf):
+    # The first sheet isn't necessarily stored as sheet1.xml (deleting or
+    # reordering sheets renumbers the parts), so resolve it the way the
+    # format intends: workbook.xml lists sheets in tab order with a
+    # relationship id, and the rels part maps that id to the member path.
+    try:
+        with zf.open('xl/workbook.xml') as f:
+            sheets = ElementTree.parse(f).getroot().find(NS + 'sheets')
+        first = sheets.find(NS + 'sheet') if sheets is not None else None
+        rid = first.get(RID_ATTR) if first is not None else None
+        if rid:
+            with zf.open('xl/_rels/workbook.xml.rels') as f:
+                rels = ElementTree.parse(f).getroot()
+            for rel in rels.findall(REL_NS + 'Relationship'):
+                if rel.get('Id') == rid:
+                    target = rel.get('Target', '').lstrip('/')
+                    if not target.startswith('xl/'):
+                        target = 'xl/' + target
+                    return target
+    except (KeyError, ElementTree.ParseError):
+        pass
+    # Fallback: first worksheet member present in the archive
+    for name in sorted(zf.namelist()):
+        if name.startswith('xl/worksheets/') and name.endswith('.xml'):
+            return name
+    raise KeyError('no worksheet found in workbook')
+
+def _load_shared_strings(zf):
+    strings = []
+    try:
+        with zf.open('xl/sharedStrings.xml') as f:
+            for _, elem in ElementTree.iterparse(f):
+                if elem.tag == NS + 'si':
+                    strings.append(''.join(t.text or '' for t in elem.iter(NS + 't')))
+                    elem.clear()
+    except KeyError:
+        pass # no shared strings part
+    return strings
+
+def _load_bold_styles(zf):
+    # Resolve styleId -> bold once (cellXfs xf -> fontId -> font/b),
+    # so the row loop checks a set instead of walking a style DOM.
+    bold_styles = set()
+    try:
+        with zf.open('xl/styles.xml') as f:
+            root = ElementTree.parse(f).getroot()
+    except KeyError:
+        return bold_styles
+
+    bold_fonts = []
+    fonts = root.find(NS + 'fonts')
+    if fonts is not None:
+        for font in fonts.findall(NS + 'font'):
+            bold_fonts.append(font.find(NS + 'b') is not None)
+
+    xfs = root.find(NS + 'cellXfs')
+    if xfs is not None:
+        for i, xf in enumerate(xfs.findall(NS + 'xf')):
+            font_id = int(xf.get('fontId', 0) or 0)
+            if font_id < len(bold_fonts) and bold_fonts[font_id]:
+                bold_styles.add(i)
+    return bold_styles
+
+def _cell_text(cell, strings):
+    v = cell.find(NS + 'v')
+    if v is not None and v.text is not None:
+        if cell.get('t') == 's':
+            try:
+                return strings[int(v.text)]
+            except (ValueError, IndexError):
+                return v.text
+        return v.text
+    # Inline string cells keep their text under <is>
+    inline = cell.find(NS + 'is')
+    if inline is not None:
+        return ''.join(t.text or '' for t in inline.iter(NS + 't'))
+    return None
+
+def iter_sheet_rows(source, bold_cols=None):
+    """
+    Streams the first worksheet of an xlsx file.
+    source: bytes, or any seekable binary file object (e.g. the spooled
+    upload file itself, avoiding a full in-memory copy).
+    bold_cols: optional set of column indices to resolve bold flags for;
+    None resolves every column. Callers that only inspect column A can
+    pass {0} and skip the style lookup on the rest of the row.
+    Yields (row_number, values, bold_flags) where values are stripped strings
+    ('' for empty cells) and bold_flags mirrors values per column.
+    """
+    if isinstance(source, (bytes, bytearray)):
+        source = io.BytesIO(source)
+    with zipfile.ZipFile(source) as zf:
+        # sharedStrings and styles are independent zip members and zlib
+        # releases the GIL while inflating, so the two loads overlap;
+        # ZipFile handles concurrent member reads with its internal lock.
+        with ThreadPoolExecutor(max_workers=2) as ex:
+            strings_f = ex.submit(_load_shared_strings, zf)
+            bold_styles = _load_bold_styles(zf)
+            strings = strings_f.result()
+
+        with zf.open(_first_sheet_path(zf)) as f:
+            for _, elem in ElementTree.iterparse(f):
+                if elem.tag != NS + 'row':
+                    continue
+
+                row_num = int(elem.get('r', 0) or 0)
+                values = []
+                bolds = []
+                for cell in elem.findall(NS + 'c'):
+                    col = _col_index(cell.get('r'))
+                    if col is None:
+                        continue
+                    while len(values) <= col:
+                        values.append('')
+                        bolds.append(False)
+
+                    text = _cell_text(cell, strings)
+                    if text is not None:
+                        values[col] = str(text).strip()
+                    if bold_cols is None or col in bold_cols:
+                        try:
+                            bolds[col] = int(cell.get('s', -1)) in bold_styles
+                        except ValueError:
+                            pass
+
+                yield row_num, values, bolds
+                elem.clear() # keep memory flat: drop the row subtree
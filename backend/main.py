@@ -1,21 +1,37 @@
-from fastapi import FastAPI, UploadFile, File, HTTPException
+from fastapi import FastAPI, UploadFile, File, HTTPException, BackgroundTasks
+from fastapi.responses import ORJSONResponse
 from typing import List
-import pandas as pd
-import io
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from .models import ScheduleRequest, ScheduledTask, SyncRequest, DateUpdateRequest, AsanaConfig
 from .services import Scheduler, AsanaManager
 from .date_logic import recalculate_dates, auto_recalibrate
 from .database import init_db, save_baseline, update_actuals, get_all_history
+from .excel_stream import iter_sheet_rows
+import anyio
 import asyncio
-import json
+import hashlib
+import orjson
 import os
+import re
 import time
-import openpyxl
+import logging
 from fastapi.concurrency import run_in_threadpool
 
+logger = logging.getLogger(__name__)
+
 CONFIG_FILE = "polling_config.json"
 
-app = FastAPI()
+# Splits 'A | B|C' style cells, consuming surrounding whitespace in the split
+_PIPE_SPLIT = re.compile(r'\s*\|\s*')
+
+# Numeric tokens in a 'days' cell ('3 | 5.0 | -2'); matching instead of
+# split+try/except skips the exception machinery on malformed cells
+_NUM_RE = re.compile(r'-?\d+(?:\.\d+)?')
+
+# orjson for every response body; the big /visualize payloads stop paying
+# stdlib json encoding on the event loop
+app = FastAPI(default_response_class=ORJSONResponse)
 
 # Global State for Polling
 polling_config = {
@@ -28,83 +44,219 @@ polling_config = {
 def load_config():
     if os.path.exists(CONFIG_FILE):
         try:
-            with open(CONFIG_FILE, 'r') as f:
-                data = json.load(f)
+            with open(CONFIG_FILE, 'rb') as f:
+                data = orjson.loads(f.read())
                 polling_config.update(data)
-                print(f"Loaded config: Polling Active={polling_config['active']}")
+                logger.info("Loaded config: Polling Active=%s", polling_config['active'])
         except Exception as e:
-            print(f"Error loading config: {e}")
+            logger.warning("Error loading config: %s", e)
 
 def save_config():
     try:
-        with open(CONFIG_FILE, 'w') as f:
-            json.dump(polling_config, f)
+        # Write-then-rename: a crash mid-write can no longer corrupt the
+        # config the auto-restart path depends on (os.replace is atomic).
+        tmp = CONFIG_FILE + '.tmp'
+        with open(tmp, 'wb') as f:
+            f.write(orjson.dumps(polling_config))
+        os.replace(tmp, CONFIG_FILE)
     except Exception as e:
-        print(f"Error saving config: {e}")
+        logger.warning("Error saving config: %s", e)
 
-async def background_poller():
-    print("Background Poller Started")
+# Set by the polling endpoints so the poller wakes immediately instead of
+# finishing out a full interval sleep.
+config_changed = asyncio.Event()
+
+# Debounced config persistence: endpoints mark the config dirty and move on;
+# a background writer coalesces bursts and does the (atomic) disk write off
+# the event loop.
+config_dirty = asyncio.Event()
+
+async def _config_writer():
     while True:
-        if polling_config["active"] and polling_config["pat"] and polling_config["project_gid"]:
+        await config_dirty.wait()
+        await asyncio.sleep(0.5) # coalesce rapid toggles into one write
+        config_dirty.clear()
+        await run_in_threadpool(save_config)
+
+# One AsanaManager — and therefore one warm urllib3 pool and delta-fetch
+# cache — per credential pair, shared by the poller and the routes.
+# Only touched on the event loop, so no lock is needed.
+_manager_cache = {}
+
+def get_manager(pat, project_gid):
+    key = (pat, project_gid)
+    manager = _manager_cache.get(key)
+    if manager is None:
+        manager = _manager_cache[key] = AsanaManager(pat, project_gid)
+    return manager
+
+class _TokenBucket:
+    # Minimal async token bucket: acquire() waits on the event loop (never
+    # blocks a thread) until a token refills at the configured rate.
+    def __init__(self, rate_per_min, burst):
+        self.rate = rate_per_min / 60.0
+        self.capacity = float(burst)
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1.0:
+                    self.tokens -= 1.0
+                    return
+                await asyncio.sleep((1.0 - self.tokens) / self.rate)
+
+# Shared by every Asana write path (create, link, move, auto-sync push) so
+# concurrent requests coordinate against one ceiling: 140/min leaves margin
+# under Asana's 150/min limit for the poller's reads.
+asana_limiter = _TokenBucket(140, 10)
+
+async def background_poller():
+    # Three-stage pipeline: fetch | recalibrate | DB-write + Asana push.
+    # Bounded queues connect the stages, so cycle N+1's fetch can start
+    # while cycle N's DB write and pushes are still in flight, without
+    # letting a slow stage pile up unbounded work behind it.
+    logger.info("Background Poller Started")
+    to_process_q = asyncio.Queue(maxsize=2)
+    to_io_q = asyncio.Queue(maxsize=2)
+
+    async def fetch_loop():
+        last_tasks_hash = None
+        while True:
+            if polling_config["active"] and polling_config["pat"] and polling_config["project_gid"]:
+                try:
+                    manager = get_manager(polling_config["pat"], polling_config["project_gid"])
+
+                    # 1. Fetch (delta: events-driven, full fetch only to prime)
+                    tasks = await run_in_threadpool(manager.fetch_project_tasks_incremental)
+
+                    # Idle polls are the common case: if nothing Asana returned
+                    # differs from last cycle, skip recalibration and DB writes.
+                    tasks_hash = hashlib.blake2b(
+                        orjson.dumps(tasks, option=orjson.OPT_SORT_KEYS)
+                    ).digest()
+                    if tasks_hash != last_tasks_hash:
+                        last_tasks_hash = tasks_hash
+                        await to_process_q.put((manager, tasks))
+
+                except Exception as e:
+                    logger.exception("[Auto-Sync] Fetch Error: %s", e)
+
+            # Sleep until the next cycle, but wake immediately on config changes
+            try:
+                await asyncio.wait_for(config_changed.wait(), timeout=polling_config["interval"])
+            except asyncio.TimeoutError:
+                pass
+            config_changed.clear()
+
+    async def process_loop():
+        while True:
+            manager, tasks = await to_process_q.get()
             try:
-                # Run sync Asana calls in threadpool to avoid blocking main loop
-                manager = AsanaManager(polling_config["pat"], polling_config["project_gid"])
-                
-                # 1. Fetch
-                tasks = await run_in_threadpool(manager.fetch_project_tasks)
-                
                 # 2. Check for violations & Recalibrate
                 # auto_recalibrate returns ONLY modified tasks
                 updates = auto_recalibrate(tasks)
-                
-                # Update DB with current state (Actuals)
-                # Pass ALL tasks to update_actuals to ensure we capture everything, 
-                # or just do it periodically? Doing it every poll is fine for <100 tasks.
+                await to_io_q.put((manager, tasks, updates))
+            except Exception as e:
+                logger.exception("[Auto-Sync] Recalibrate Error: %s", e)
+
+    # gid -> (start_on, due_on, name) last written to the DB; lets a cycle
+    # where only a few tasks moved write just those rows.
+    actuals_seen = {}
+
+    async def io_loop():
+        while True:
+            manager, tasks, updates = await to_io_q.get()
+
+            # Update DB with current state (Actuals) — but only the tasks
+            # whose signature differs from what we last wrote.
+            async def write_db():
+                changed = []
+                for t in tasks:
+                    gid = t.get('gid')
+                    if not gid: continue
+                    sig = (t.get('start_on'), t.get('due_on'), t.get('name'))
+                    if actuals_seen.get(gid) != sig:
+                        changed.append((t, sig))
+                if not changed:
+                    return
                 try:
-                    await run_in_threadpool(update_actuals, tasks)
+                    await run_in_threadpool(update_actuals, [t for t, _ in changed])
+                    for t, sig in changed:
+                        actuals_seen[t['gid']] = sig
                 except Exception as db_e:
-                    print(f"DB Update Failed: {db_e}")
-
-                # 3. Push Updates
-                if updates:
-                    print(f"[Auto-Sync] Violation Detected! Updating {len(updates)} tasks...")
-                    for t in updates:
-                        await run_in_threadpool(manager.update_task_dates, t['gid'], t['start_on'], t['due_on'])
-                    print("[Auto-Sync] Update Complete.")
-                else:
-                    # print("[Auto-Sync] No violations found.")
-                    pass
-                    
-            except Exception as e:
-                print(f"[Auto-Sync] Error: {e}")
-        
-        await asyncio.sleep(polling_config["interval"])
+                    logger.warning("DB Update Failed: %s", db_e)
+
+            # 3. Push Updates
+            async def push_updates():
+                if not updates:
+                    return
+                try:
+                    logger.info("[Auto-Sync] Violation Detected! Updating %d tasks...", len(updates))
+                    # Batch API: 10 updates per round-trip, batches
+                    # running concurrently under the same 5-wide cap the
+                    # create path uses. One limiter token per request.
+                    push_sem = asyncio.Semaphore(5)
+
+                    async def push_chunk(chunk):
+                        async with push_sem:
+                            await asana_limiter.acquire()
+                            await run_in_threadpool(manager.batch_update_task_dates, chunk)
+
+                    chunks = [updates[i:i + 10] for i in range(0, len(updates), 10)]
+                    await asyncio.gather(*(push_chunk(c) for c in chunks))
+                    logger.info("[Auto-Sync] Update Complete.")
+                except Exception as e:
+                    logger.exception("[Auto-Sync] Push Error: %s", e)
+
+            # DB write and Asana push overlap; neither stalls the other
+            await asyncio.gather(write_db(), push_updates())
+
+    await asyncio.gather(fetch_loop(), process_loop(), io_loop())
 
 @app.on_event("startup")
 async def startup_event():
+    # Every Asana call goes through run_in_threadpool; anyio's default
+    # 40-token limiter can saturate when the poller and a sync overlap.
+    # THREAD_POOL_SIZE is per uvicorn worker process, not global.
+    pool_size = int(os.getenv("THREAD_POOL_SIZE", "64"))
+    anyio.to_thread.current_default_thread_limiter().total_tokens = pool_size
+    # Keep plain asyncio executor paths (loop.run_in_executor) in agreement
+    asyncio.get_running_loop().set_default_executor(
+        ThreadPoolExecutor(max_workers=pool_size)
+    )
+
     init_db()
     load_config()
     # Force auto-enable if credentials exist
     if polling_config["pat"] and polling_config["project_gid"]:
         polling_config["active"] = True
-        print(f"[Startup] Credentials found. Auto-starting polling for project {polling_config['project_gid']}")
+        logger.info("[Startup] Credentials found. Auto-starting polling for project %s", polling_config['project_gid'])
     
     asyncio.create_task(background_poller())
+    asyncio.create_task(_config_writer())
 
 @app.post("/start-polling")
 async def start_polling(config: AsanaConfig):
     polling_config["pat"] = config.pat
     polling_config["project_gid"] = config.project_gid
     polling_config["active"] = True
-    save_config()
-    print(f"Polling ENABLED for Project {config.project_gid}")
+    config_dirty.set()
+    config_changed.set()
+    logger.info("Polling ENABLED for Project %s", config.project_gid)
     return {"status": "Polling Started"}
 
 @app.post("/stop-polling")
 async def stop_polling():
     polling_config["active"] = False
-    save_config()
-    print("Polling DISABLED")
+    config_dirty.set()
+    config_changed.set()
+    logger.info("Polling DISABLED")
     return {"status": "Polling Stopped"}
 
 @app.get("/polling-status")
@@ -112,114 +264,130 @@ async def get_polling_status():
     return polling_config
 
 
+# Re-uploading the same workbook is common while iterating in the UI;
+# hashing the body (~GB/s) is far cheaper than reparsing it. Small LRU.
+_parse_cache = OrderedDict()
+_PARSE_CACHE_MAX = 8
+
+def _parse_workbook_sync(source):
+    # Runs in a worker thread via run_in_threadpool: iterating the sheet XML
+    # is pure CPU and would otherwise block the event loop for the whole file.
+    # Streaming parser: rows come straight off the worksheet XML with
+    # shared strings and bold styles pre-resolved, instead of openpyxl
+    # building a DOM of every cell first.
+    tasks_data = []
+    current_section = "General"
+
+    # Column indices as plain locals (-1 = column absent): data rows index
+    # values directly instead of going through a dict-lookup closure.
+    i_task = i_trig = i_days = i_team = i_resp = -1
+    header_found = False
+
+    # Only column A's boldness matters (section detection); skip style
+    # resolution for every other cell.
+    for i, values, bolds in iter_sheet_rows(source, bold_cols={0}):
+        # 0. Check for Section in Column A (Index 0) ALWAYS
+        # Assumption: Section headers are in the first column and are BOLD.
+        val_A = values[0] if values else ""
+        bold_A = bolds[0] if bolds else False
+
+        # If Col A is Bold and has text, it's a Section
+        if val_A and bold_A:
+             if val_A.lower() != "responsible":
+                 current_section = val_A
+                 # print(f"Section Detected: {current_section}")
+
+        # 1. Detect Header Row
+        if not header_found:
+            # Debug: Print headers found in potential row
+            # print(f"Checking row for headers: {values}")
+            if 'Task' in values and 'Triggering task' in values:
+                for idx, val in enumerate(values):
+                    if val == 'Task': i_task = idx
+                    if val == 'Triggering task': i_trig = idx
+                    if val == 'days': i_days = idx
+                    if val.lower() == 'team': i_team = idx
+                    if val.lower() == 'responsible': i_resp = idx
+                header_found = True
+                logger.debug("Headers Found! Task=%d Triggering=%d days=%d", i_task, i_trig, i_days)
+            continue
+
+        # 2. Logic for Data Rows
+        if i_task < 0: continue
+
+        # Process Task
+        n_vals = len(values)
+        task_name = values[i_task] if i_task < n_vals else ""
+        if not task_name or task_name.lower() == 'nan': continue
+        if task_name in ['Task', 'Triggering task']: continue
+
+        # It's a Task
+        triggers_raw = values[i_trig] if 0 <= i_trig < n_vals else ""
+        days_raw = values[i_days] if 0 <= i_days < n_vals else ""
+        team_val = values[i_team] if 0 <= i_team < n_vals else ""
+        resp_val = values[i_resp] if 0 <= i_resp < n_vals else ""
+
+        if triggers_raw or days_raw:
+             # print(f"Task: {task_name} | Triggers: '{triggers_raw}' | Days: '{days_raw}'")
+             pass
+
+        # Precompiled split-and-strip in one pass; cell values arrive
+        # already edge-stripped from the streaming reader.
+        triggers = [t for t in _PIPE_SPLIT.split(triggers_raw) if t]
+        lags = [int(float(m.group())) for m in _NUM_RE.finditer(days_raw)] if days_raw else []
+
+        # Use Row Index as Unique ID
+        unique_id = f"row_{i}"
+
+        tasks_data.append({
+            "id": unique_id,
+            "name": task_name,
+            "duration": 0,
+            "triggering_tasks": triggers,
+            "lag_days": lags,
+            "section": current_section,
+            "team": team_val,
+            "responsible": resp_val
+        })
+
+    return tasks_data
+
 @app.post("/parse-excel")
 async def parse_excel(file: UploadFile = File(...)):
     if not file.filename.endswith('.xlsx'):
         raise HTTPException(status_code=400, detail="Invalid file format")
-    
-    contents = await file.read()
+
+    # Hash the spooled upload in chunks (no full read into memory)
+    hasher = hashlib.blake2b(digest_size=16)
+    await file.seek(0)
+    while chunk := await file.read(1 << 20):
+        hasher.update(chunk)
+    cache_key = hasher.digest()
+
+    if cache_key in _parse_cache:
+        _parse_cache.move_to_end(cache_key)
+        return {"tasks": _parse_cache[cache_key]}
+
+    # No file.read() into memory: Starlette already spools the upload to a
+    # temp file past ~1MB, and the zip reader seeks in it directly.
+    await file.seek(0)
     try:
-        # Use openpyxl to detect styles (Bold = Section)
-        wb = openpyxl.load_workbook(io.BytesIO(contents), data_only=True)
-        sheet = wb.active
-        
-        tasks_data = []
-        current_section = "General"
-        
-        col_map = {} # 'Task': idx, 'Triggering': idx, 'days': idx
-        header_found = False
-        
-        for i, row in enumerate(sheet.iter_rows(min_row=1, values_only=False), start=1):
-            # Convert row cells to values for logic
-            values = [str(c.value).strip() if c.value is not None else "" for c in row]
-            
-            # 0. Check for Section in Column A (Index 0) ALWAYS
-            # Assumption: Section headers are in the first column and are BOLD.
-            cell_A = row[0]
-            val_A = str(cell_A.value).strip() if cell_A.value else ""
-            
-            # If Col A is Bold and has text, it's a Section
-            if val_A and cell_A.font and cell_A.font.b:
-                 if val_A.lower() != "responsible":
-                     current_section = val_A
-                     # print(f"Section Detected: {current_section}")
-
-            # 1. Detect Header Row
-            if not header_found:
-                # Debug: Print headers found in potential row
-                # print(f"Checking row for headers: {values}")
-                if 'Task' in values and 'Triggering task' in values:
-                    for idx, val in enumerate(values):
-                        if val == 'Task': col_map['Task'] = idx
-                        if val == 'Triggering task': col_map['Triggering'] = idx
-                        if val == 'days': col_map['days'] = idx
-                        if val.lower() == 'team': col_map['Team'] = idx
-                        if val.lower() == 'responsible': col_map['Responsible'] = idx
-                    header_found = True
-                    print(f"Headers Found! Map: {col_map}")
-                continue 
-
-            # 2. Logic for Data Rows
-            if not col_map: continue
-            
-            # Process Task
-            def get_cell(key):
-                idx = col_map.get(key)
-                if idx is None or idx >= len(row): return None
-                return row[idx]
-
-            task_cell = get_cell('Task')
-            if not task_cell or not task_cell.value: continue
-            
-            task_name = str(task_cell.value).strip()
-            if not task_name or task_name.lower() == 'nan': continue
-            if task_name in ['Task', 'Triggering task']: continue
-            
-            # It's a Task
-            trig_cell = get_cell('Triggering')
-            days_cell = get_cell('days')
-            team_cell = get_cell('Team')
-            resp_cell = get_cell('Responsible')
-            
-            triggers_raw = str(trig_cell.value).strip() if trig_cell and trig_cell.value else ""
-            days_raw = str(days_cell.value).strip() if days_cell and days_cell.value else ""
-            team_val = str(team_cell.value).strip() if team_cell and team_cell.value else ""
-            resp_val = str(resp_cell.value).strip() if resp_cell and resp_cell.value else ""
-            
-            if triggers_raw or days_raw:
-                 # print(f"Task: {task_name} | Triggers: '{triggers_raw}' | Days: '{days_raw}'")
-                 pass
-            
-            triggers = [t.strip() for t in triggers_raw.split('|') if t.strip()]
-            lags = []
-            if days_raw:
-                try:
-                   lags = [int(float(d.strip())) for d in days_raw.split('|') if d.strip()]
-                except: pass
-                
-            # Use Row Index as Unique ID
-            unique_id = f"row_{i}"
-            
-            tasks_data.append({
-                "id": unique_id,
-                "name": task_name,
-                "duration": 0, 
-                "triggering_tasks": triggers,
-                "lag_days": lags,
-                "section": current_section,
-                "team": team_val,
-                "responsible": resp_val
-            })
-            
+        tasks_data = await run_in_threadpool(_parse_workbook_sync, file.file)
+
+        _parse_cache[cache_key] = tasks_data
+        if len(_parse_cache) > _PARSE_CACHE_MAX:
+            _parse_cache.popitem(last=False)
+
         return {"tasks": tasks_data}
-        
+
     except Exception as e:
-        import traceback
-        traceback.print_exc()
+        logger.exception("Error parsing Excel")
         raise HTTPException(status_code=500, detail=f"Error parsing Excel: {str(e)}")
 
 @app.post("/schedule")
 def schedule_tasks(request: ScheduleRequest):
+    # Deliberately a plain def: pure CPU work, so FastAPI runs it in the
+    # threadpool and the event loop stays free.
     scheduler = Scheduler()
     
     # 1. Add all tasks (First Pass)
@@ -261,31 +429,70 @@ def schedule_tasks(request: ScheduleRequest):
     scheduler.calculate_dates()
     return scheduler.get_scheduled_tasks()
 
-@app.post("/sync-asana")
-def sync_asana(request: SyncRequest):
-    manager = AsanaManager(request.config.pat, request.config.project_gid)
-    
-    # 1. Setup Custom Fields & Fetch Users
-    print("Setting up Custom Fields & Fetching Users...")
+# Workspace metadata (custom-field gids, user map) changes at most rarely,
+# so cache it per (PAT, project) and skip ~4 serial Asana round-trips on
+# repeat syncs. Keyed on a PAT hash so the token isn't held in plaintext.
+_WS_CTX_TTL = 3600
+_ws_ctx_cache = {}
+
+async def _resolve_workspace_ctx(manager, pat, project_gid):
+    key = (hashlib.sha256(pat.encode()).hexdigest()[:16], project_gid)
+    cached = _ws_ctx_cache.get(key)
+    if cached and time.time() - cached[0] < _WS_CTX_TTL:
+        return cached[1]
+
+    logger.info("Setting up Custom Fields & Fetching Users...")
     ws_gid = manager.get_workspace_gid()
-    team_gid = manager.ensure_text_custom_field("Team", ws_gid)
-    resp_gid = manager.ensure_text_custom_field("Responsible", ws_gid)
-    
-    # Check for User-requested "Start Date" and "End_date" (Create if missing)
-    sd_gid, sd_type = manager.ensure_date_custom_field("Start Date", ws_gid)
-    ed_gid, ed_type = manager.ensure_date_custom_field("End_date", ws_gid)
-    
-    # Fetch Users for Assignment
-    users_map = manager.fetch_workspace_users(ws_gid)
-    print(f"Fetched {len(users_map)} users for assignment mapping.")
+
+    # The five listings below are independent (distinct field names, users,
+    # sections), so overlap their round-trips in the threadpool instead of
+    # paying one serial RTT each. Section priming rides along so the later
+    # move phase starts with a warm cache.
+    team_gid, resp_gid, sd, ed, users_map, _ = await asyncio.gather(
+        run_in_threadpool(manager.ensure_text_custom_field, "Team", ws_gid),
+        run_in_threadpool(manager.ensure_text_custom_field, "Responsible", ws_gid),
+        run_in_threadpool(manager.ensure_date_custom_field, "Start Date", ws_gid),
+        run_in_threadpool(manager.ensure_date_custom_field, "End_date", ws_gid),
+        run_in_threadpool(manager.fetch_workspace_users, ws_gid),
+        run_in_threadpool(manager._prime_section_cache),
+    )
+    logger.info("Fetched %d users for assignment mapping.", len(users_map))
+
+    ctx = {
+        'ws_gid': ws_gid,
+        'team_gid': team_gid,
+        'resp_gid': resp_gid,
+        'start_field': sd,
+        'end_field': ed,
+        'users_map': users_map
+    }
+    _ws_ctx_cache[key] = (time.time(), ctx)
+    return ctx
+
+@app.post("/sync-asana")
+async def sync_asana(request: SyncRequest, bg: BackgroundTasks):
+    # async route: every blocking Asana/DB call goes through
+    # run_in_threadpool so a long sync doesn't pin the event loop.
+    manager = get_manager(request.config.pat, request.config.project_gid)
+
+    # 1. Setup Custom Fields & Fetch Users (cached per workspace)
+    ctx = await _resolve_workspace_ctx(manager, request.config.pat, request.config.project_gid)
+    team_gid = ctx['team_gid']
+    resp_gid = ctx['resp_gid']
+    sd_gid, sd_type = ctx['start_field']
+    ed_gid, ed_type = ctx['end_field']
+    users_map = ctx['users_map']
     
     # 2. Create Tasks (Baseline)
-    print("Creating Tasks...")
+    # Creation is network-bound, so keep several requests in flight instead
+    # of one serial call per task; the semaphore caps concurrency to stay
+    # inside Asana's rate limit.
+    logger.info("Creating Tasks...")
     baseline_tasks = []
-    
-    created_count = 0
-    
-    for task in request.tasks:
+
+    create_sem = asyncio.Semaphore(5)
+
+    async def create_one(task):
         # Construct Description (Keep checks just in case)
         notes_parts = []
         if task.team: notes_parts.append(f"Team: {task.team}")
@@ -296,14 +503,14 @@ def sync_asana(request: SyncRequest):
         c_fields = {}
         if team_gid and task.team: c_fields[team_gid] = task.team
         if resp_gid and task.responsible: c_fields[resp_gid] = task.responsible
-        
+
         # Populate Start Date
         if sd_gid and task.start_date:
             if sd_type == 'date':
                 c_fields[sd_gid] = {'date': task.start_date}
             else:
                 c_fields[sd_gid] = task.start_date
-                
+
         # Populate End_date
         if ed_gid and task.end_date:
             if ed_type == 'date':
@@ -316,115 +523,181 @@ def sync_asana(request: SyncRequest):
         # Try matching 'Responsible' first, then 'Team'
         # Check against name or email in users_map
         if task.responsible:
-             assignee_gid = users_map.get(task.responsible.lower())
-        
+             assignee_gid = users_map.get(task.responsible.casefold())
+
         if not assignee_gid and task.team:
-             assignee_gid = users_map.get(task.team.lower())
+             assignee_gid = users_map.get(task.team.casefold())
 
         # Create task in Asana (Asana allows duplicate names)
-        gid = manager.create_task_with_dates(
-            task.name, 
-            task.start_date, 
-            task.end_date, 
-            notes=notes_str,
-            custom_fields=c_fields,
-            assignee=assignee_gid
-        )
+        async with create_sem:
+            await asana_limiter.acquire()
+            gid = await run_in_threadpool(
+                manager.create_task_with_dates,
+                task.name,
+                task.start_date,
+                task.end_date,
+                notes=notes_str,
+                custom_fields=c_fields,
+                assignee=assignee_gid
+            )
+        return task, gid
+
+    results = await asyncio.gather(*(create_one(t) for t in request.tasks))
+
+    # One pass over the create results feeds everything downstream: the
+    # registry, the baseline rows, and the created list the link phase
+    # walks (no re-scan of request.tasks per phase).
+    reg = manager.task_registry
+    created = []
+    for task, gid in results:
         if gid:
             # Map Scheduler ID to Asana GID
-            manager.task_registry[task.id] = gid
-            created_count += 1
-            
+            reg[task.id] = gid
+            created.append((gid, task))
+
             baseline_tasks.append({
                 'gid': gid,
                 'name': task.name,
                 'start_on': task.start_date,
                 'due_on': task.end_date
             })
-    
-    try:
-        run_in_threadpool(save_baseline, baseline_tasks)
-    except Exception as e:
-        print(f"Failed to save baseline: {e}")
+    created_count = len(created)
+
+    # Baseline persistence runs after the response is sent; the client
+    # only needs the create+link outcome.
+    bg.add_task(_persist_baseline, baseline_tasks)
 
     # 2. Link Dependencies
+    # Group predecessors by successor: add_dependencies_for_task takes the
+    # whole list, so fan-in costs one API call per successor, not per edge.
+    by_succ = {}
     linked_count = 0
-    for t in request.tasks:
-        # t.id -> Successor GID
-        suc_gid = manager.task_registry.get(t.id)
-        if not suc_gid: continue
-        
-        # t.dependencies is list of Predecessor IDs
-        for pred_id in t.dependencies:
-            pred_gid = manager.task_registry.get(pred_id)
-            if pred_gid:
-                manager.link_dependency(suc_gid, pred_gid)
-                linked_count += 1
-                time.sleep(0.3) # Prevent Rate Limiting
+    for gid, t in created:
+        preds = [reg[p] for p in t.dependencies if p in reg]
+        if preds:
+            by_succ[gid] = preds
+            linked_count += len(preds)
+
+    link_sem = asyncio.Semaphore(3)
+
+    async def link_one(suc_gid, pred_gids):
+        async with link_sem:
+            await asana_limiter.acquire()
+            await run_in_threadpool(manager.link_dependencies, suc_gid, pred_gids)
+
+    await asyncio.gather(*(link_one(s, p) for s, p in by_succ.items()))
                 
-    # 3. Handle Sections
-    print("Handling Sections...")
+    # 3. Handle Sections — slow fanout, deferred to after the response
+    bg.add_task(_move_sections, manager, request.tasks)
+
+    return {"status": "success", "created": created_count, "linked": linked_count}
+
+async def _persist_baseline(baseline_tasks):
+    try:
+        await run_in_threadpool(save_baseline, baseline_tasks)
+        _history_cache["ts"] = 0.0 # new baseline: drop the /visualize cache
+    except Exception as e:
+        logger.warning("Failed to save baseline: %s", e)
+
+async def _move_sections(manager, tasks):
+    logger.info("Handling Sections...")
     gid_map = manager.task_registry # ID -> GID
-    
+
     try:
-        for task in request.tasks:
-                if task.section and task.id in gid_map:
-                    try:
-                        sec_gid = manager.get_or_create_section(task.section)
-                        if sec_gid:
-                            manager.move_task_to_section(gid_map[task.id], sec_gid)
-                    except Exception as e:
-                        print(f"Failed to move {task.name} to section {task.section}: {e}")
-    except Exception as ie:
-        print(f"CRITICAL ERROR in Section Loop: {ie}")
-        import traceback
-        traceback.print_exc()
+        # Resolve each distinct section ONCE, serially — get_or_create_section
+        # mutates the manager's cache and racing it could duplicate sections.
+        section_gids = {}
+        for task in tasks:
+            if task.section and task.section not in section_gids and task.id in gid_map:
+                try:
+                    section_gids[task.section] = await run_in_threadpool(manager.get_or_create_section, task.section)
+                except Exception as e:
+                    logger.warning("Failed to resolve section %s: %s", task.section, e)
+                    section_gids[task.section] = None
 
-    return {"status": "success", "created": created_count, "linked": linked_count}
+        # Moves are independent writes: run them concurrently under the
+        # same rate-limit cap as creation and linking.
+        move_sem = asyncio.Semaphore(5)
+
+        async def move_one(task):
+            sec_gid = section_gids.get(task.section)
+            if not sec_gid:
+                return
+            try:
+                async with move_sem:
+                    await asana_limiter.acquire()
+                    await run_in_threadpool(manager.move_task_to_section, gid_map[task.id], sec_gid)
+            except Exception as e:
+                logger.warning("Failed to move %s to section %s: %s", task.name, task.section, e)
+
+        await asyncio.gather(*(
+            move_one(t) for t in tasks if t.section and t.id in gid_map
+        ))
+    except Exception as ie:
+        logger.exception("CRITICAL ERROR in Section Loop: %s", ie)
 
 @app.post("/update-task-date")
 async def update_task_date(request: DateUpdateRequest):
-    manager = AsanaManager(request.config.pat, request.config.project_gid)
+    manager = get_manager(request.config.pat, request.config.project_gid)
     
     try:
         # 1. Fetch current state
-        tasks = manager.fetch_project_tasks()
-        
+        tasks = await run_in_threadpool(manager.fetch_project_tasks)
+
+        # Snapshot dates BEFORE recalculation (it mutates the dicts in
+        # place) so no-op pushes can be filtered afterwards.
+        current = {t['gid']: (t['start_on'], t['due_on']) for t in tasks}
+
         # 2. Recalculate
         modified_tasks = recalculate_dates(tasks, request.task_gid, request.new_end_date)
-        
-        # 3. Push updates
-        updated_count = 0
-        for t in modified_tasks:
-            # Skip the one we triggered? Or update it too (User might have updated it in UI already? 
-            # If we call this endpoint, we assume we want to enforce the change)
-            manager.update_task_dates(t['gid'], t['start_on'], t['due_on'])
-            updated_count += 1
-            
-        return {"status": "success", "updated_tasks": updated_count}
+
+        # 3. Push updates — only tasks whose dates actually moved; an
+        # idempotent re-run costs zero Asana PUTs.
+        real_updates = [
+            t for t in modified_tasks
+            if current.get(t['gid']) != (t['start_on'], t['due_on'])
+        ]
+        if len(real_updates) < len(modified_tasks):
+            logger.info("Filtered %d no-op updates", len(modified_tasks) - len(real_updates))
+
+        # 10 updates per Batch API round-trip instead of one PUT each
+        for i in range(0, len(real_updates), 10):
+            await asana_limiter.acquire()
+            await run_in_threadpool(manager.batch_update_task_dates, real_updates[i:i + 10])
+
+        return {"status": "success", "updated_tasks": len(real_updates)}
         
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+# The dashboard polls /visualize; expected dates only change on sync, so a
+# short TTL absorbs the full-table history scan between refreshes.
+_HISTORY_TTL = 5
+_history_cache = {"ts": 0.0, "data": None}
+
+async def _history_cached():
+    now = time.time()
+    if _history_cache["data"] is None or now - _history_cache["ts"] > _HISTORY_TTL:
+        _history_cache["data"] = await run_in_threadpool(get_all_history)
+        _history_cache["ts"] = now
+    return _history_cache["data"]
+
 @app.get("/visualize")
 async def visualize(pat: str, project_gid: str):
-    manager = AsanaManager(pat, project_gid)
+    manager = get_manager(pat, project_gid)
     try:
-        tasks = manager.fetch_project_tasks()
-        
-        # Enrich with Expected Dates from DB
-        history = get_all_history()
-        
+        tasks = await run_in_threadpool(manager.fetch_project_tasks)
+
+        # Enrich with Expected Dates from DB (TTL-cached)
+        history = await _history_cached()
+
+        # Single branch-free .get per task; falls back to the task's own
+        # dates when it isn't in the baseline yet (new task?)
         for t in tasks:
-            gid = t['gid']
-            if gid in history:
-                t['expected_start'] = history[gid]['expected_start']
-                t['expected_end'] = history[gid]['expected_end']
-            else:
-                 # Fallback if not in DB (new task?)
-                 t['expected_start'] = t['start_on']
-                 t['expected_end'] = t['due_on']
-                 
+            es, ee = history.get(t['gid']) or (t['start_on'], t['due_on'])
+            t['expected_start'] = es
+            t['expected_end'] = ee
+
         return tasks
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -1,56 +1,187 @@
 import asana
+import json
+import re
+import sys
+import urllib3
 from asana.rest import ApiException
 from datetime import datetime, timedelta
+from functools import lru_cache
 import collections
+import numpy as np
 from typing import List, Dict, Optional
 from .models import ScheduledTask, AsanaConfig
 
-def add_business_days(from_date: datetime, days_to_add: int) -> datetime:
-    current = from_date
-    while days_to_add > 0:
-        current += timedelta(days=1)
-        if current.weekday() < 5: # Mon-Fri
-            days_to_add -= 1
-    return current
+try:
+    # Optional: JIT-compiles the CPM kernel below when numba is installed.
+    # cache=True persists the compile across process restarts.
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        # numba is optional; the kernel runs un-jitted without it
+        def wrap(fn):
+            return fn
+        if args and callable(args[0]):
+            return args[0]
+        return wrap
+
+_EPOCH = datetime(1970, 1, 1)
+
+# C-level sub beats a per-character Python generator for id sanitizing
+_NONALNUM = re.compile(r'[^A-Za-z0-9]')
+
+@lru_cache(maxsize=4096)
+def _day_to_ymd(day):
+    # Scheduled plans repeat the same few dates across many tasks
+    return (_EPOCH + timedelta(days=day)).date().isoformat()
+
+@njit(cache=True)
+def _weekday(day):
+    # days-since-epoch -> weekday; 1970-01-01 was a Thursday (3)
+    return (day + 3) % 7
+
+@njit(cache=True)
+def _snap_forward(day):
+    wd = _weekday(day)
+    if wd == 5: return day + 2
+    if wd == 6: return day + 1
+    return day
+
+@njit(cache=True)
+def _add_busdays(day, n):
+    # 'day' must already be a weekday; adds n business days in O(1)
+    if n <= 0:
+        return day
+    end = day + 7 * (n // 5) + (n % 5)
+    if _weekday(day) + (n % 5) >= 5:
+        end += 2
+    return end
+
+@njit(cache=True)
+def _cpm_forward(n, durations, edge_src, edge_dst, edge_lag, day0):
+    """
+    Kahn topological forward pass of the schedule over integer day numbers:
+    each node is finalized once, each edge relaxed once — O(N+E) instead of
+    the old fixed-point sweeps. Returns (starts, ends, processed); a cycle
+    leaves processed < n, with the cycle's nodes kept at their defaults.
+    """
+    starts = np.empty(n, np.int64)
+    ends = np.empty(n, np.int64)
+    for i in range(n):
+        starts[i] = day0
+        ends[i] = _add_busdays(day0, durations[i] - 1)
+
+    n_edges = edge_dst.shape[0]
+
+    # CSR of outgoing edge ids per source node
+    indegree = np.zeros(n, np.int64)
+    counts = np.zeros(n, np.int64)
+    for e in range(n_edges):
+        indegree[edge_dst[e]] += 1
+        counts[edge_src[e]] += 1
+    indptr = np.zeros(n + 1, np.int64)
+    for i in range(n):
+        indptr[i + 1] = indptr[i] + counts[i]
+    fill = indptr[:n].copy()
+    out_edges = np.empty(n_edges, np.int64)
+    for e in range(n_edges):
+        s = edge_src[e]
+        out_edges[fill[s]] = e
+        fill[s] += 1
+
+    # limit[v] = latest predecessor finish (+lag) seen so far
+    limit = np.full(n, day0, np.int64)
+    queue = np.empty(n, np.int64)
+    head = 0
+    tail = 0
+    for i in range(n):
+        if indegree[i] == 0:
+            queue[tail] = i
+            tail += 1
+
+    processed = 0
+    while head < tail:
+        u = queue[head]
+        head += 1
+        processed += 1
+        # All predecessors of u are final: fix u's dates now
+        if limit[u] > starts[u]:
+            starts[u] = _snap_forward(limit[u])
+            ends[u] = _add_busdays(starts[u], durations[u] - 1)
+        for k in range(indptr[u], indptr[u + 1]):
+            e = out_edges[k]
+            v = edge_dst[e]
+            cand = ends[u] + edge_lag[e]
+            if cand > limit[v]:
+                limit[v] = cand
+            indegree[v] -= 1
+            if indegree[v] == 0:
+                queue[tail] = v
+                tail += 1
+
+    return starts, ends, processed
 
 class Scheduler:
     def __init__(self):
         self.tasks = {}  # ID -> TaskData
         self.tasks_by_name = collections.defaultdict(list) # Name -> [List of IDs]
-        self.adjacency = collections.defaultdict(list)  # Pred_ID -> [(Succ_ID, Lag)]
-        self.reverse_adjacency = collections.defaultdict(list)  # Succ_ID -> [(Pred_ID, Lag)]
+        self.tasks_by_name_lower = collections.defaultdict(list) # name.lower() -> [IDs]
+        self.tasks_by_name_section = {} # (name.lower(), section) -> first ID
+        # Inner dicts dedupe repeated links (same sheet row parsed twice):
+        # one edge per pair, keeping the largest lag.
+        self.adjacency = collections.defaultdict(dict)  # Pred_ID -> {Succ_ID: Lag}
+        self.reverse_adjacency = collections.defaultdict(dict)  # Succ_ID -> {Pred_ID: Lag}
+        # get_scheduled_tasks memo: any graph or date mutation re-arms it
+        self._dirty = True
+        self._cached_scheduled = None
 
     def add_task(self, task_id, name, section=None, team=None, responsible=None):
+        # Interned keys: every index and adjacency map hashes these
+        # strings constantly, and interning makes equality a pointer
+        # compare on the dict fast path.
+        task_id = sys.intern(task_id)
+        name = sys.intern(name)
+        if section: section = sys.intern(section)
         if task_id not in self.tasks:
+            self._dirty = True
+            # start/end are integer days-since-epoch: the schedule math in
+            # calculate_dates never leaves int-land, and formatting happens
+            # once, in get_scheduled_tasks.
+            today = (datetime.now() - _EPOCH).days
             self.tasks[task_id] = {
                 'id': task_id,
                 'name': name,
-                'start_date': datetime.now(),
+                'start_date': today,
                 'duration': 0,
-                'end_date': datetime.now(),
+                'end_date': today,
                 'gid': None,
                 'section': section,
                 'team': team,
                 'responsible': responsible
             }
             self.tasks_by_name[name].append(task_id)
+            self.tasks_by_name_lower[name.lower()].append(task_id)
+            self.tasks_by_name_section.setdefault((name.lower(), section), task_id)
 
     def get_scheduled_tasks(self) -> List[ScheduledTask]:
+        # Serialization and diffing both call this per request; rebuild
+        # only after something actually changed.
+        if not self._dirty and self._cached_scheduled is not None:
+            return self._cached_scheduled
         sorted_tasks = sorted(self.tasks.values(), key=lambda x: x['start_date'])
         result = []
         for t in sorted_tasks:
             dep_ids = []
             dep_names = []
             if t['id'] in self.reverse_adjacency:
-                for pred_id, _ in self.reverse_adjacency[t['id']]:
+                for pred_id in self.reverse_adjacency[t['id']]:
                     dep_ids.append(pred_id)
                     dep_names.append(self.tasks[pred_id]['name'])
             
             result.append(ScheduledTask(
                 id=t['id'],
                 name=t['name'],
-                start_date=t['start_date'].strftime("%Y-%m-%d"),
-                end_date=t['end_date'].strftime("%Y-%m-%d"),
+                start_date=_day_to_ymd(t['start_date']),
+                end_date=_day_to_ymd(t['end_date']),
                 duration=t['duration'],
                 dependencies=dep_ids,
                 dependency_names=dep_names,
@@ -58,113 +189,162 @@ class Scheduler:
                 team=t.get('team'),
                 responsible=t.get('responsible')
             ))
+        self._cached_scheduled = result
+        self._dirty = False
         return result
 
     def resolve_successor(self, predecessor_id, successor_name, lag_days):
         predecessor = self.tasks.get(predecessor_id)
         if not predecessor: return
         
-        # 1. Try Exact Match
-        candidates = self.tasks_by_name.get(successor_name, [])
-        
-        # 2. Try Case-Insensitive Match if needed
-        if not candidates:
-            successor_name_lower = successor_name.lower()
-            for name, ids in self.tasks_by_name.items():
-                if name.lower() == successor_name_lower:
-                    candidates.extend(ids)
-                    break
-        
-        selected_succ_id = None
         pred_section = predecessor.get('section')
 
-        if candidates:
-            # 1. Context-Aware: Check Same Section
-            if pred_section:
-                for cand_id in candidates:
-                    if self.tasks[cand_id].get('section') == pred_section:
-                        selected_succ_id = cand_id
-                        break
-            
-            # 2. Global Fallback: Pick first available
-            if not selected_succ_id:
+        # 1. Context-Aware: same name in the same section is a single
+        # probe of the composite index kept in add_task
+        selected_succ_id = self.tasks_by_name_section.get(
+            (successor_name.lower(), pred_section))
+
+        # 2. Global Fallback: exact name, then case-insensitive
+        if not selected_succ_id:
+            candidates = self.tasks_by_name.get(successor_name) \
+                or self.tasks_by_name_lower.get(successor_name.lower())
+            if candidates:
                 selected_succ_id = candidates[0]
         
         # 3. Auto-Create if Not Found
         if not selected_succ_id:
-            safe_name = "".join(c for c in successor_name if c.isalnum())
-            safe_sec = "".join(c for c in (pred_section or "general") if c.isalnum())
-            new_id = f"auto_{safe_name}_{safe_sec}"[:50] 
+            safe_name = _NONALNUM.sub('', successor_name)
+            safe_sec = _NONALNUM.sub('', pred_section or "general")
+            new_id = sys.intern(f"auto_{safe_name}_{safe_sec}"[:50])
             self.add_task(new_id, successor_name, section=pred_section)
             selected_succ_id = new_id
             
-        self.adjacency[predecessor_id].append((selected_succ_id, lag_days))
-        self.reverse_adjacency[selected_succ_id].append((predecessor_id, lag_days))
+        fwd = self.adjacency[predecessor_id]
+        prev = fwd.get(selected_succ_id)
+        if prev is None or lag_days > prev:
+            fwd[selected_succ_id] = lag_days
+            self.reverse_adjacency[selected_succ_id][predecessor_id] = lag_days
+            self._dirty = True
         
         return selected_succ_id
 
     def inherit_missing_sections(self):
-        for t_id, task in self.tasks.items():
+        # Walk tasks in topological order (Kahn) so a chain of orphans
+        # inherits transitively: by the time an orphan is visited, every
+        # predecessor's section is final. One pass, O(V+E).
+        indegree = {tid: len(self.reverse_adjacency.get(tid, ())) for tid in self.tasks}
+        queue = collections.deque(tid for tid, deg in indegree.items() if deg == 0)
+        order = []
+        while queue:
+            u = queue.popleft()
+            order.append(u)
+            for succ_id in self.adjacency.get(u, ()):
+                if succ_id in indegree:
+                    indegree[succ_id] -= 1
+                    if indegree[succ_id] == 0:
+                        queue.append(succ_id)
+
+        # Cycle members never dequeue; append them so they still get the
+        # old single-hop lookup.
+        if len(order) < len(self.tasks):
+            seen = set(order)
+            order.extend(tid for tid in self.tasks if tid not in seen)
+
+        for t_id in order:
+            task = self.tasks[t_id]
             if not task.get('section'):
-                preds = self.reverse_adjacency[t_id]
-                for pred_id, _ in preds:
+                for pred_id in self.reverse_adjacency.get(t_id, ()):
                     pred_sec = self.tasks.get(pred_id, {}).get('section')
                     if pred_sec:
                         task['section'] = pred_sec
+                        self._dirty = True
                         break
 
     def calculate_dates(self):
         today = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
-        for t in self.tasks.values():
-            t['start_date'] = today
-            while t['start_date'].weekday() >= 5:
-                 t['start_date'] += timedelta(days=1)
-            d = max(1, t['duration'])
-            t['end_date'] = add_business_days(t['start_date'], d - 1)
-
-        changed = True
-        iterations = 0
-        max_iter = len(self.tasks) + 10
-
-        while changed and iterations < max_iter:
-            changed = False
-            iterations += 1
-            for task_name in self.tasks:
-                task = self.tasks[task_name]
-                preds = self.reverse_adjacency[task_name]
-                if not preds: continue
-
-                max_pred_finish = today
-                for pred_name, lag in preds:
-                    if pred_name in self.tasks:
-                        pred_end = self.tasks[pred_name]['end_date']
-                        candidate_start = pred_end + timedelta(days=lag)
-                        if candidate_start > max_pred_finish:
-                            max_pred_finish = candidate_start
-
-                if max_pred_finish > task['start_date']:
-                    task['start_date'] = max_pred_finish
-                    while task['start_date'].weekday() >= 5:
-                        task['start_date'] += timedelta(days=1)
-                    d = max(1, task['duration'])
-                    task['end_date'] = add_business_days(task['start_date'], d - 1)
-                    changed = True
-        return iterations
+
+        # Struct-of-Arrays: one dense index per task plus flat predecessor
+        # edge arrays, so the relaxation runs inside the _cpm_forward kernel
+        # instead of dict lookups per task per iteration.
+        ids = list(self.tasks)
+        n = len(ids)
+        if n == 0:
+            return 0
+        id_to_idx = {tid: i for i, tid in enumerate(ids)}
+
+        durations = np.fromiter(
+            (max(1, self.tasks[tid]['duration']) for tid in ids),
+            dtype=np.int32, count=n
+        )
+
+        # Flatten reverse_adjacency: edge i pushes dst from src's end + lag
+        edge_src = []
+        edge_dst = []
+        edge_lag = []
+        for succ_id, preds in self.reverse_adjacency.items():
+            u = id_to_idx.get(succ_id)
+            if u is None: continue
+            for pred_id, lag in preds.items():
+                p = id_to_idx.get(pred_id)
+                if p is not None:
+                    edge_src.append(p)
+                    edge_dst.append(u)
+                    edge_lag.append(lag)
+        edge_src = np.asarray(edge_src, dtype=np.int32)
+        edge_dst = np.asarray(edge_dst, dtype=np.int32)
+        edge_lag = np.asarray(edge_lag, dtype=np.int64)
+
+        # Everyone starts today (snapped off weekends); the kernel works on
+        # integer days-since-epoch so it can be JIT-compiled.
+        day0 = _snap_forward((today - _EPOCH).days)
+
+        starts, ends, processed = _cpm_forward(
+            n, durations, edge_src, edge_dst, edge_lag, day0
+        )
+        if processed < n:
+            print(f"[Scheduler] Dependency cycle detected: {n - processed} tasks kept default dates")
+
+        # Write results back as plain ints; rendering waits for
+        # get_scheduled_tasks
+        for i, tid in enumerate(ids):
+            task = self.tasks[tid]
+            task['start_date'] = int(starts[i])
+            task['end_date'] = int(ends[i])
+        self._dirty = True
+        return processed
 
 class AsanaManager:
     def __init__(self, pat, project_gid):
         self.project_gid = project_gid
         config = asana.Configuration()
         config.access_token = pat
+        # The SDK's ApiClient keeps one urllib3 pool for the manager's
+        # lifetime, so every call after the first reuses a warm TLS
+        # connection. Size the pool for our concurrent create path and
+        # retry transient 5xx/429s with backoff instead of failing a sync.
+        config.connection_pool_maxsize = 10
+        config.retry_strategy = urllib3.util.Retry(
+            total=3, backoff_factor=0.3,
+            status_forcelist=[429, 500, 502, 503, 504]
+        )
         self.client = asana.ApiClient(config)
         self.tasks_api = asana.TasksApi(self.client)
         self.sections_api = asana.SectionsApi(self.client)
         self.custom_fields_api = asana.CustomFieldsApi(self.client)
         self.projects_api = asana.ProjectsApi(self.client)
         self.users_api = asana.UsersApi(self.client)
+        self.events_api = asana.EventsApi(self.client)
+        self.batch_api = asana.BatchAPIApi(self.client)
         self.task_registry = {}
-        self.section_cache = {} 
+        self.section_cache = {}
+        self._sections_primed = False
+        self._fields_primed = False
         self.custom_field_cache = {}
+        # Delta-fetch state: parsed tasks by gid plus the events sync token.
+        # Only meaningful when the manager outlives one call (the poller
+        # keeps a single instance across cycles).
+        self.tasks_cache = {}
+        self._sync_token = None
 
     def get_workspace_gid(self):
         # Static Workspace GID from User URL: https://app.asana.com/1/1212999353094131/...
@@ -187,13 +367,16 @@ class AsanaManager:
             count = 0
             for u in users:
                 count += 1
-                gid = u.get('gid') if isinstance(u, dict) else getattr(u, 'gid', None)
-                name = u.get('name') if isinstance(u, dict) else getattr(u, 'name', None)
-                email = u.get('email') if isinstance(u, dict) else getattr(u, 'email', None)
-                
+                # Normalize the row shape once; the inserts below are
+                # then plain dict gets with no isinstance dispatch.
+                if not isinstance(u, dict): u = u.to_dict()
+                gid = u.get('gid')
                 if gid:
-                    if name: users_map[name.lower()] = gid
-                    if email: users_map[email.lower()] = gid
+                    name = u.get('name')
+                    email = u.get('email')
+                    # casefold: locale-proof case-insensitive keys
+                    if name: users_map[name.casefold()] = gid
+                    if email: users_map[email.casefold()] = gid
             
             print(f"[AsanaManager] Successfully fetched {count} users.")
             return users_map
@@ -201,58 +384,31 @@ class AsanaManager:
             print(f"[AsanaManager] Error fetching users: {e}")
             return users_map
 
-    # ... (ensure_text_custom_field matches below, skipped here for brevity if unchanged logic, but replacing block) ...
-    # I will keep ensure_text_custom_field as is in the file, just targeting init and adding fetch_users
-    # Wait, replace_file_content targets specific lines. 
-    # I need to target __init__ (lines 155-166) and insert fetch_workspace_users somewhere.
-    # And update create_task_with_dates (lines 291-309).
-
-    def create_task_with_dates(self, name, start_dt_str, due_dt_str, notes="", custom_fields=None, assignee=None):
-        data = {
-            "name": name, "projects": [self.project_gid],
-            "start_on": start_dt_str,
-            "due_on": due_dt_str,
-            "notes": notes
-        }
-        if custom_fields:
-            data["custom_fields"] = custom_fields
-        if assignee:
-            data["assignee"] = assignee
-
-        body = {"data": data}
-        try:
-            result = self.tasks_api.create_task(body, {})
-            if not isinstance(result, dict): result = result.to_dict()
-            gid = result['data']['gid'] if 'data' in result else result['gid']
-            return gid
-        except ApiException as e:
-            with open("CRITICAL_ERROR.log", "w") as f:
-                f.write(f"Error creating task {name}: Status={e.status}, Body={e.body}")
-            print(f"Error creating task {name}: Status={e.status}, Body={e.body}")
-            return None
-
-
+    def _prime_custom_field_cache(self):
+        # One settings listing caches EVERY field's (gid, type); later
+        # misses mean the field truly doesn't exist — no re-listing.
+        settings = self.custom_fields_api.get_custom_field_settings_for_project(self.project_gid, {})
+        for s in settings:
+            cf = s.get('custom_field') if isinstance(s, dict) else getattr(s, 'custom_field', None)
+            if not cf: continue
+            c_name = cf.get('name') if isinstance(cf, dict) else getattr(cf, 'name', None)
+            c_gid = cf.get('gid') if isinstance(cf, dict) else getattr(cf, 'gid', None)
+            c_type = cf.get('type') if isinstance(cf, dict) else getattr(cf, 'type', 'text')
+            if c_name and c_gid:
+                self.custom_field_cache.setdefault(c_name, (c_gid, c_type))
+        self._fields_primed = True
 
     def find_custom_field(self, name):
         """Finds a custom field by name and returns (gid, type)."""
-        if name in self.custom_field_cache: 
-             val = self.custom_field_cache[name]
-             if isinstance(val, tuple): return val
-             return val, 'text'
-
         try:
-            settings = self.custom_fields_api.get_custom_field_settings_for_project(self.project_gid, {})
-            for s in settings:
-                cf = s.get('custom_field') if isinstance(s, dict) else getattr(s, 'custom_field', None)
-                if cf:
-                    c_name = cf.get('name') if isinstance(cf, dict) else getattr(cf, 'name', None)
-                    if c_name == name:
-                        c_gid = cf.get('gid') if isinstance(cf, dict) else getattr(cf, 'gid', None)
-                        c_type = cf.get('type') if isinstance(cf, dict) else getattr(cf, 'type', 'text')
-                        
-                        self.custom_field_cache[name] = (c_gid, c_type)
-                        return c_gid, c_type
-            
+            if name not in self.custom_field_cache and not self._fields_primed:
+                self._prime_custom_field_cache()
+
+            if name in self.custom_field_cache:
+                val = self.custom_field_cache[name]
+                if isinstance(val, tuple): return val
+                return val, 'text'
+
             print(f"[AsanaManager] Custom Field '{name}' not found in project.")
             return None, None
         except Exception as e:
@@ -358,20 +514,31 @@ class AsanaManager:
             print(f"[AsanaManager] Error creating/finding field '{name}': {e}")
             return None
 
+    def _prime_section_cache(self):
+        # One listing call caches EVERY section, so each later name misses
+        # straight to create instead of re-listing the project.
+        sections = self.sections_api.get_sections_for_project(self.project_gid, {'opt_fields': 'name'})
+        for s in sections:
+            s_name = s.get('name') if isinstance(s, dict) else getattr(s, 'name', None)
+            s_gid = s.get('gid') if isinstance(s, dict) else getattr(s, 'gid', None)
+            if s_name and s_gid:
+                # Lowercased keys: 'QA' and 'qa' in the sheet resolve to
+                # the same project section instead of creating a twin
+                self.section_cache.setdefault(s_name.strip().lower(), s_gid)
+        self._sections_primed = True
+
     def get_or_create_section(self, section_name):
         section_name = section_name.strip()
-        if section_name in self.section_cache:
-            return self.section_cache[section_name]
-        
+        cache_key = section_name.lower()
+        if cache_key in self.section_cache:
+            return self.section_cache[cache_key]
+
         try:
-            sections = self.sections_api.get_sections_for_project(self.project_gid, {'opt_fields': 'name'})
-            for s in sections:
-                s_name = s.get('name') if isinstance(s, dict) else getattr(s, 'name', None)
-                s_gid = s.get('gid') if isinstance(s, dict) else getattr(s, 'gid', None)
-                if s_name == section_name:
-                    self.section_cache[section_name] = s_gid
-                    return s_gid
-            
+            if not self._sections_primed:
+                self._prime_section_cache()
+                if cache_key in self.section_cache:
+                    return self.section_cache[cache_key]
+
             body = {"data": {"name": section_name}}
             opts = {'body': body}
             res = self.sections_api.create_section_for_project(self.project_gid, opts)
@@ -381,7 +548,7 @@ class AsanaManager:
             
             gid = res_data.get('gid') if isinstance(res_data, dict) else getattr(res_data, 'gid', None)
             if gid:
-                self.section_cache[section_name] = gid
+                self.section_cache[cache_key] = gid
                 return gid
             return None
         except ApiException as e:
@@ -397,31 +564,108 @@ class AsanaManager:
         except ApiException as e:
              print(f"[AsanaManager] Error moving task {task_gid} to section: {e}")
 
+    _TASK_FIELDS = "name,start_on,due_on,dependencies,parent"
+
+    def fetch_project_tasks_iter(self):
+        # Generator over the SDK's paginated stream: rows flow to the
+        # caller as each page lands instead of waiting for the full list.
+        opts = {'opt_fields': self._TASK_FIELDS, 'limit': 100}
+        try:
+            for t in self.tasks_api.get_tasks_for_project(self.project_gid, opts):
+                # Skip placeholder rows before paying for to_dict/parse
+                name = t.get('name') if isinstance(t, dict) else getattr(t, 'name', None)
+                if name == 'Task': continue
+                if not isinstance(t, dict): t = t.to_dict()
+                yield self._parse_task(t)
+        except ApiException as e:
+            raise Exception(f"Fetch Failed: {e.reason}")
+
     def fetch_project_tasks(self):
-        tasks_map = {}
-        fields_string = "name,start_on,due_on,dependencies,parent"
-        opts = {'opt_fields': fields_string}
+        # Asana guarantees gid uniqueness within a project, so a flat
+        # list is enough — no dedup dict.
+        return list(self.fetch_project_tasks_iter())
+
+    def _prime_events_token(self):
+        # A sync-less events call 412s by design; the fresh token rides
+        # in the error body.
+        try:
+            self.events_api.get_events(self.project_gid, {})
+        except ApiException as e:
+            try:
+                self._sync_token = json.loads(e.body).get('sync')
+            except Exception:
+                self._sync_token = None
+
+    def _prime_tasks_cache(self):
+        tasks = self.fetch_project_tasks()
+        self.tasks_cache = {t['gid']: t for t in tasks}
+        self._prime_events_token()
+        return list(self.tasks_cache.values())
+
+    def fetch_project_tasks_incremental(self):
+        """
+        Poller variant of fetch_project_tasks: the first call does a full
+        fetch and primes an events sync token; later calls pull only the
+        tasks the events stream says changed, so traffic scales with edits
+        rather than project size. Falls back to a full re-prime when the
+        token expires (412).
+        """
+        if self._sync_token is None or not self.tasks_cache:
+            return self._prime_tasks_cache()
+
         try:
-            all_tasks = self.tasks_api.get_tasks_for_project(self.project_gid, opts)
-            for t in all_tasks:
+            result = self.events_api.get_events(self.project_gid, {'sync': self._sync_token})
+        except ApiException as e:
+            if e.status == 412:
+                # Token expired: re-prime from scratch
+                return self._prime_tasks_cache()
+            raise Exception(f"Events Fetch Failed: {e.reason}")
+
+        if not isinstance(result, dict):
+            result = result.to_dict()
+        self._sync_token = result.get('sync') or self._sync_token
+
+        changed = set()
+        removed = set()
+        for ev in result.get('data', []):
+            res = ev.get('resource') or {}
+            if res.get('resource_type') != 'task': continue
+            gid = res.get('gid')
+            if not gid: continue
+            if ev.get('action') in ('deleted', 'removed'):
+                removed.add(gid)
+            else:
+                changed.add(gid)
+
+        for gid in removed:
+            self.tasks_cache.pop(gid, None)
+
+        opts = {'opt_fields': self._TASK_FIELDS}
+        for gid in changed - removed:
+            try:
+                t = self.tasks_api.get_task(gid, opts)
                 if not isinstance(t, dict): t = t.to_dict()
                 if t.get('name') == 'Task': continue
                 parsed = self._parse_task(t)
-                tasks_map[parsed['gid']] = parsed
-            return list(tasks_map.values())
-        except ApiException as e:
-            raise Exception(f"Fetch Failed: {e.reason}")
+                self.tasks_cache[parsed['gid']] = parsed
+            except ApiException:
+                # Task vanished between event and fetch
+                self.tasks_cache.pop(gid, None)
+
+        return list(self.tasks_cache.values())
 
     def _parse_task(self, api_task):
-        deps = [d['gid'] for d in api_task.get('dependencies', [])]
         due_str = api_task.get('due_on')
         start_str = api_task.get('start_on')
-        now_str = datetime.now().strftime("%Y-%m-%d")
-        if not due_str: due_str = now_str
-        if not start_str: start_str = due_str or now_str
+        if not due_str or not start_str:
+            # lru-cached formatter: no strftime per dateless task
+            now_str = _day_to_ymd((datetime.now() - _EPOCH).days)
+            if not due_str: due_str = now_str
+            if not start_str: start_str = due_str
         return {
             'gid': api_task.get('gid'), 'name': api_task.get('name', 'Unnamed'),
-            'start_on': start_str, 'due_on': due_str, 'dependencies': deps
+            'start_on': start_str, 'due_on': due_str,
+            'dependencies': [d['gid'] for d in api_task.get('dependencies', [])]
         }
 
     def create_task_with_dates(self, name, start_dt_str, due_dt_str, notes="", custom_fields=None, assignee=None):
@@ -449,12 +693,36 @@ class AsanaManager:
             return None
 
     def link_dependency(self, dependent_gid, predecessor_gid):
-        body = {"data": {"dependencies": [predecessor_gid]}}
+        self.link_dependencies(dependent_gid, [predecessor_gid])
+
+    def link_dependencies(self, dependent_gid, predecessor_gids):
+        # The endpoint takes the whole list: one call per successor,
+        # not one per edge.
+        if not predecessor_gids: return
+        body = {"data": {"dependencies": list(predecessor_gids)}}
         try:
             self.tasks_api.add_dependencies_for_task(body, dependent_gid)
         except ApiException as e:
              print(f"Error linking dependency: {e}")
 
+    def batch_update_task_dates(self, updates):
+        """
+        Pushes date changes through the Batch API: up to 10 task updates
+        per HTTP round-trip instead of one PUT each.
+        updates: list of dicts with 'gid', 'start_on', 'due_on'.
+        """
+        for i in range(0, len(updates), 10):
+            chunk = updates[i:i + 10]
+            actions = [{
+                "method": "put",
+                "relative_path": f"/tasks/{u['gid']}",
+                "data": {"start_on": u['start_on'], "due_on": u['due_on']}
+            } for u in chunk]
+            try:
+                self.batch_api.create_batch_request({"data": {"actions": actions}}, {})
+            except ApiException as e:
+                print(f"Error in batch date update: {e}")
+
     def update_task_dates(self, task_gid, start_on, due_on):
         body = {
             "data": {
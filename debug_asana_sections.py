@@ -54,9 +54,10 @@ def debug_sections():
             # 3. Test Move Task (Need a task GID)
             # Fetch one task
             print("\n--- Fetching a task for move test ---")
-            tasks = manager.fetch_project_tasks()
-            if tasks:
-                target_task = tasks[0]
+            # One task is enough: pull the first off the streaming fetch
+            # instead of listing the whole project.
+            target_task = next(manager.fetch_project_tasks_iter(), None)
+            if target_task:
                 t_gid = target_task['gid']
                 print(f"Attempting to move task '{target_task['name']}' ({t_gid}) into 'Debug Section' ({sec_gid})")
                 
@@ -0,0 +1,15 @@
+
+import openpyxl
+from functools import lru_cache
+
+# The one-off debug scripts all poke at the same workbook, and every
+# load_workbook call re-decompresses the zip and re-parses the shared
+# strings and style tables. Memoizing the read-only handle pays that
+# cost once per session no matter how many scripts run. The cache owns
+# the handle — callers must not close() it.
+
+file_path = r"c:\Users\Acer\Desktop\asana_pms\Infill New.xlsx"
+
+@lru_cache(maxsize=2)
+def open_infill(path=file_path, read_only=True):
+    return openpyxl.load_workbook(path, data_only=True, read_only=read_only)
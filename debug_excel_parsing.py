@@ -1,6 +1,5 @@
 
-import pandas as pd
-import io
+from debug_common import open_infill
 
 # Path to the file
 file_path = r"c:\Users\Acer\Desktop\asana_pms\Infill New.xlsx"
@@ -9,40 +8,46 @@ def test_parsing():
     print(f"Testing parsing for {file_path}")
     
     try:
-        # Read without header to process row by row
-        df = pd.read_excel(file_path, header=None)
+        # Stream rows instead of materializing the whole sheet as a
+        # DataFrame first; empty cells become '' up front, so no 'nan'
+        # string round-trip either.
+        sheet = open_infill(file_path).active
         
         current_section = "General" 
         col_map = {} 
+        i_task = i_trig = i_days = -1
         
         tasks_found = 0
         sections_found = 0
         
         print("\n--- Starting Row Scan ---")
         
-        for index, row in df.iterrows():
-            values = [str(x).strip() for x in row.values]
-            
-            # Check for Header Row
-            if 'Task' in values and 'Triggering task' in values:
-                for idx, val in enumerate(values):
-                    if val == 'Task': col_map['Task'] = idx
-                    if val == 'Triggering task': col_map['Triggering'] = idx
-                    if val == 'days': col_map['days'] = idx
-                print(f"Row {index}: DETECTED HEADER ROW. Map: {col_map}")
-                continue 
-                
-            if not col_map: continue
-            
-            def get_val(key):
-                idx = col_map.get(key)
-                if idx is None or idx >= len(values): return ""
-                val = values[idx]
-                return "" if val.lower() == 'nan' else val
+        for index, row in enumerate(sheet.iter_rows(values_only=True), start=1):
+            # Until the header lands, probe the raw tuple (C-level 'in')
+            # and stringify only candidate rows; afterwards stringify just
+            # the three consulted cells instead of the whole row.
+            if not col_map:
+                if 'Task' in row and 'Triggering task' in row:
+                    values = ['' if v is None else str(v).strip() for v in row]
+                    for idx, val in enumerate(values):
+                        if val == 'Task': col_map['Task'] = idx
+                        if val == 'Triggering task': col_map['Triggering'] = idx
+                        if val == 'days': col_map['days'] = idx
+                    # Local ints for the scan below: direct indexing beats
+                    # a dict probe per key per row
+                    i_task = col_map.get('Task', -1)
+                    i_trig = col_map.get('Triggering', -1)
+                    i_days = col_map.get('days', -1)
+                    print(f"Row {index}: DETECTED HEADER ROW. Map: {col_map}")
+                continue
             
-            task_name = get_val('Task')
-            triggers_raw = get_val('Triggering')
-            days_raw = get_val('days')
+            n_vals = len(row)
+            v = row[i_task] if 0 <= i_task < n_vals else None
+            task_name = '' if v is None else str(v).strip()
+            v = row[i_trig] if 0 <= i_trig < n_vals else None
+            triggers_raw = '' if v is None else str(v).strip()
+            v = row[i_days] if 0 <= i_days < n_vals else None
+            days_raw = '' if v is None else str(v).strip()
             
             if not task_name: continue
             
@@ -1,12 +1,13 @@
 
-import openpyxl
+from debug_common import open_infill
 
 file_path = r"c:\Users\Acer\Desktop\asana_pms\Infill New.xlsx"
 
 def inspect_styles():
     print(f"Opening {file_path} with openpyxl...")
     try:
-        wb = openpyxl.load_workbook(file_path, data_only=True)
+        # Shared memoized handle; only the 20 inspected rows are parsed
+        wb = open_infill(file_path)
         sheet = wb.active
         
         print("\n--- Inspecting First 20 Rows ---")
@@ -24,7 +25,7 @@ def inspect_styles():
             fill_color = cell_c.fill.start_color.index if cell_c.fill else "None"
             
             print(f"   => Col C Style: Bold={is_bold}, Fill={fill_color}")
-            
+
     except Exception as e:
         print(f"Error: {e}")
 
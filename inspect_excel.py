@@ -5,8 +5,12 @@ import json
 file_path = r"c:\Users\Acer\Desktop\asana_pms\Infill New.xlsx"
 
 try:
-    # Read first 120 rows to capture the first two sections shown in screenshots
-    df = pd.read_excel(file_path, header=None, nrows=120)
+    # Read first 120 rows to capture the first two sections shown in screenshots.
+    # Explicit openpyxl engine + ExcelFile: guarantees the nrows-aware read
+    # path (older pandas parsed the full sheet before truncating) and closes
+    # the zip handle deterministically.
+    with pd.ExcelFile(file_path, engine='openpyxl') as xl:
+        df = pd.read_excel(xl, header=None, nrows=120)
     
     # Print the first 10 rows and rows around 100-110 to see the transition
     print("--- HEAD (0-10) ---")
@@ -1,19 +1,25 @@
 
-import openpyxl
 import io
+import sys
+
+from debug_common import open_infill
 
 file_path = r"c:\Users\Acer\Desktop\asana_pms\Infill New.xlsx"
 
 def list_sections():
     print(f"Scanning {file_path} for sections...")
     try:
-        wb = openpyxl.load_workbook(file_path, data_only=True)
+        # Shared memoized read-only handle; styles still resolve
+        # through the shared style table.
+        wb = open_infill(file_path)
         sheet = wb.active
         
-        found_sections = []
-        seen = set()
+        # dict-as-ordered-set: one hash op per add, insertion order kept
+        found_sections = {}
         
-        for i, row in enumerate(sheet.iter_rows(), start=1):
+        # Column A only: the read-only parser skips every other cell's
+        # XML instead of materializing full rows.
+        for i, row in enumerate(sheet.iter_rows(min_col=1, max_col=1), start=1):
             # Check Column A (Index 0)
             cell_A = row[0]
             val_A = str(cell_A.value).strip() if cell_A.value else ""
@@ -21,15 +27,17 @@ def list_sections():
             # Use exact logic from main.py
             if val_A and cell_A.font and cell_A.font.b:
                  if val_A.lower() != "responsible":
-                     if val_A not in seen:
-                         found_sections.append(val_A)
-                         seen.add(val_A)
-                         print(f"Row {i}: Found Section -> {val_A}")
+                     # remember the first row each section appears on
+                     found_sections.setdefault(val_A, i)
         
+        # One buffered write each instead of a print (lock + flush) per
+        # section inside the scan loop
+        sys.stdout.write("".join(
+            f"Row {i}: Found Section -> {name}\n" for name, i in found_sections.items()
+        ))
         with open("sections_list.txt", "w") as f:
-            for s in found_sections:
-                f.write(f"- {s}\n")
-                print(f"- {s}")
+            f.writelines(f"- {name}\n" for name in found_sections)
+        sys.stdout.write("".join(f"- {name}\n" for name in found_sections))
             
     except Exception as e:
         print(f"Error: {e}")